@@ -1,15 +1,26 @@
 import sys
 import cv2
 import numpy as np
-from PIL import Image, ImageEnhance
+from PIL import Image
 import customtkinter as ctk
 from customtkinter import filedialog
 import io
+import os
 import logging
-from typing import Dict, Optional
-import gc
+from typing import Dict, List, Optional, Tuple
+from functools import lru_cache, partial
+import queue
+import threading
 from tkinter import messagebox
 
+try:
+    from numba import get_num_threads, njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from numba_lock import NUMBA_LOCK
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -20,11 +31,60 @@ logging.basicConfig(
     ]
 )
 
+if NUMBA_AVAILABLE:
+    # nogil lets the Tk thread keep handling events while the render worker runs the kernel
+    @njit(parallel=True, nogil=True, fastmath=True, cache=True)
+    def _noise_kernel(src, dst, sigma):
+        """Add Gaussian noise to a uint8 image and clamp to [0, 255] in a single pass"""
+        height, width, channels = src.shape
+        for i in prange(height):
+            for j in range(width):
+                for c in range(channels):
+                    value = src[i, j, c] + sigma * np.random.randn()
+                    if value < 0:
+                        dst[i, j, c] = 0
+                    elif value > 255:
+                        dst[i, j, c] = 255
+                    else:
+                        dst[i, j, c] = np.uint8(value)
+
+# Sliders move in whole steps, so the tables are memoized per integer setting
+@lru_cache(maxsize=512)
+def _build_bc_lut(brightness: int, contrast: int) -> np.ndarray:
+    """Build a 256-entry uint8 lookup table applying brightness then contrast"""
+    lut = np.arange(256, dtype=np.float32)
+    lut *= 1 + brightness / 100
+    lut = (lut - 128) * (1 + contrast / 100) + 128
+    return np.clip(lut, 0, 255).astype(np.uint8)
+
+@lru_cache(maxsize=256)
+def _build_sat_lut(saturation: int) -> np.ndarray:
+    """Build a per-channel HSV lookup table that scales S and leaves H and V untouched"""
+    identity = np.arange(256, dtype=np.uint8)
+    sat = np.clip(np.arange(256, dtype=np.float32) * (1 + saturation / 100), 0, 255).astype(np.uint8)
+    return np.dstack((identity, sat, identity))
+
+@lru_cache(maxsize=256)
+def _build_sharpen_kernel(sharpness: int) -> np.ndarray:
+    """Build a 3x3 kernel computing (1 + k) * img - k * gaussian(img) in one convolution"""
+    k = sharpness / 100
+    gaussian = cv2.getGaussianKernel(3, 1.0, ktype=cv2.CV_32F)
+    kernel = -k * (gaussian @ gaussian.T)
+    kernel[1, 1] += 1 + k
+    return kernel
+
 class ImageEditor(ctk.CTkToplevel):
     """
     Image Editor application for applying various effects and filters to images.
     Supports multiple image formats and provides real-time preview of effects.
     """
+
+    # Bounding box of the downscaled copy that interactive edits are rendered on
+    PREVIEW_SIZE = (1600, 1200)
+    # Smaller copy used while a slider is being dragged; the preview is re-rendered on release
+    DRAFT_SIZE = (800, 600)
+    # How often the Tk thread checks for finished renders while one is outstanding
+    RENDER_POLL_MS = 10
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -33,7 +93,38 @@ class ImageEditor(ctk.CTkToplevel):
         # Initialize image variables with type hints
         self.image: Optional[Image.Image] = None
         self.original_image: Optional[Image.Image] = None
+        self._preview_image: Optional[Image.Image] = None
+        self._original_arr: Optional[np.ndarray] = None
+        self._preview_arr: Optional[np.ndarray] = None
+        self._original_alpha: Optional[np.ndarray] = None
+        self._preview_alpha: Optional[np.ndarray] = None
+        self._draft_image: Optional[Image.Image] = None
+        self._draft_arr: Optional[np.ndarray] = None
+        self._draft_alpha: Optional[np.ndarray] = None
+        self._stage_buffers: Dict[str, np.ndarray] = {}
+        self._stage_cache: List[Tuple[tuple, np.ndarray]] = []
+        self._stage_source: Optional[np.ndarray] = None
         self.display_photo: Optional[ctk.CTkImage] = None
+        self._displayed_image: Optional[Image.Image] = None
+        self._last_display_size: Optional[Tuple[int, int]] = None
+        self._noise_out: Optional[np.ndarray] = None
+        self._noise_i16: Optional[np.ndarray] = None
+        self._effect_timer: Optional[str] = None
+        self._error_pending = False
+        self._dragging = False
+        self._effects_key: Optional[tuple] = None  # Settings (and draft flag) of the last render request
+
+        # Effects are rendered on a worker thread; the queue only ever holds the latest request
+        self._render_queue: queue.Queue = queue.Queue(maxsize=1)
+        self._render_lock = threading.Lock()
+        self._render_seq = 0  # Bumped per request so results that arrive late can be dropped
+        # The worker only queues (seq, image, error) results; the Tk thread picks them up in an
+        # after() poll that runs until the latest request has come back
+        self._render_results: queue.SimpleQueue = queue.SimpleQueue()
+        self._awaited_seq = 0
+        self._render_poll: Optional[str] = None
+        self._render_thread = threading.Thread(target=self._render_worker, daemon=True)
+        self._render_thread.start()
         
         # Define supported formats with proper MIME types
         self.supported_formats: Dict[str, str] = {
@@ -49,6 +140,11 @@ class ImageEditor(ctk.CTkToplevel):
             "HEIC": "*.heic",
             "SVG": "*.svg"
         }
+        self._file_types = [("Image files", " ".join(
+            ext for exts in self.supported_formats.values() for ext in exts.split()))] + [
+            (f"{fmt} files", exts) for fmt, exts in self.supported_formats.items()]
+        self._ext_set = frozenset(
+            ext.lstrip('*').lower() for exts in self.supported_formats.values() for ext in exts.split())
         
         # Initialize settings with default values
         self.current_settings: Dict[str, float] = {
@@ -60,9 +156,33 @@ class ImageEditor(ctk.CTkToplevel):
             'saturation': 0.0
         }
         
+        if NUMBA_AVAILABLE:
+            # Start Numba's worker pool from this thread first: with the TBB layer, a pool first
+            # launched from a worker thread hangs interpreter shutdown
+            get_num_threads()
+            # Compile (or load from the on-disk cache) off the Tk thread so the window opens right away
+            threading.Thread(target=self._warm_up_kernels, daemon=True).start()
+        else:
+            self.logger.info("Numba not available, using NumPy noise path")
         self.setup_ui()
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
         
+    def _warm_up_kernels(self):
+        """Compile the Numba kernels up front so the first slider tick doesn't pay the JIT cost"""
+        try:
+            dummy = np.zeros((32, 32, 3), dtype=np.uint8)
+            # Noise-only renders pass the read-only array from np.asarray(image) straight in,
+            # which Numba compiles as a separate specialization
+            readonly = dummy.copy()
+            readonly.setflags(write=False)
+            # Taken in the same order as the render worker, which holds the render lock around
+            # its kernel calls; an early render waits here rather than launching alongside
+            with self._render_lock, NUMBA_LOCK:
+                _noise_kernel(dummy, np.empty_like(dummy), 0.0)
+                _noise_kernel(readonly, np.empty_like(dummy), 0.0)
+        except Exception:
+            self.logger.exception("Error compiling Numba kernels")
+
     def setup_ui(self):
         """Initialize and configure the user interface"""
         self.title("Image Noise Editor Pro")
@@ -257,21 +377,23 @@ class ImageEditor(ctk.CTkToplevel):
                     from_=-100,
                     to=100,
                     number_of_steps=200,
-                    command=lambda value, p=param: self.update_image(p, value),
+                    command=partial(self.update_image, param),
                     width=200,
                     height=16,
                     button_color=("gray60", "gray40"),
                     button_hover_color=("gray50", "gray30")
                 )
                 slider.pack(side="right", padx=10, pady=5)
+                slider.bind("<ButtonPress-1>", self._on_slider_press)
+                slider.bind("<ButtonRelease-1>", self._on_slider_release)
                 slider.set(0)
                 self.sliders[param] = slider
 
     def update_image_info(self):
         """Update the image information display"""
-        if self.image:
-            size = self.image.size
-            mode = self.image.mode
+        if self.original_image:
+            size = self.original_image.size
+            mode = self.original_image.mode
             self.image_info_label.configure(text=f"Format: {mode}")
             self.image_size_label.configure(text=f"Size: {size[0]}x{size[1]}px")
         else:
@@ -281,21 +403,37 @@ class ImageEditor(ctk.CTkToplevel):
     def open_image(self):
         """Open and load an image file"""
         try:
-            file_types = [("Image files", 
-                        " ".join(f"*{ext}" for exts in self.supported_formats.values() for ext in exts.split()))]
-            filename = filedialog.askopenfilename(filetypes=file_types)
+            filename = filedialog.askopenfilename(filetypes=self._file_types)
             
             if filename:
+                if os.path.splitext(filename)[1].lower() not in self._ext_set:
+                    self.show_error(f"Unsupported image format: {os.path.basename(filename)}")
+                    return
+
                 self.logger.info(f"Opening image: {filename}")
                 self.original_image = Image.open(filename)
-                self.image = self.original_image.copy()
-                self.logger.info(f"Loaded image size: {self.image.size}, format: {self.image.format}, mode: {self.image.mode}")
-                self.update_image_display()
+                self.logger.info(f"Loaded image size: {self.original_image.size}, format: {self.original_image.format}, mode: {self.original_image.mode}")
+
+                # Convert once so the pipeline only ever sees 8-bit RGB; transparency is kept aside
+                has_alpha = self.original_image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in self.original_image.info
+                base_image = self.original_image.convert('RGBA' if has_alpha else 'RGB')
+
+                # Cache the pixels once; the effect pipeline only ever reads these arrays
+                self._original_arr, self._original_alpha = self._split_alpha(base_image)
+
+                # Interactive edits run on a downscaled copy; full resolution is only rendered on save.
+                # The arrays above own their pixels, so base_image can be shrunk in place.
+                self._preview_image = base_image
+                self._preview_image.thumbnail(self.PREVIEW_SIZE, Image.Resampling.LANCZOS)
+                self._preview_arr, self._preview_alpha = self._split_alpha(self._preview_image)
+                self._draft_image = self._preview_image.copy()
+                self._draft_image.thumbnail(self.DRAFT_SIZE, Image.Resampling.LANCZOS)
+                self._draft_arr, self._draft_alpha = self._split_alpha(self._draft_image)
                 self.update_image_info()  # Update image information
-                self.reset_effects()  # Reset all sliders
+                self.reset_effects()  # Reset all sliders and show the new preview
         except Exception as e:
-            self.logger.error(f"Error opening image: {str(e)}")
-            self.show_error(f"Error opening image: {str(e)}")
+            self.logger.exception("Error opening image")
+            self.show_error(f"Error opening image: {e}")
 
     def save_image(self):
         """Save the processed image"""
@@ -316,68 +454,214 @@ class ImageEditor(ctk.CTkToplevel):
             
             if filename:
                 self.logger.info(f"Saving image to: {filename}")
-                self.image.save(filename)
+                with self._render_lock:
+                    output = self.apply_effects(full_res=True)
+                if output is not None:
+                    output.save(filename)
         except Exception as e:
-            self.logger.error(f"Error saving image: {str(e)}")
-            self.show_error(f"Error saving image: {str(e)}")
+            self.logger.exception("Error saving image")
+            self.show_error(f"Error saving image: {e}")
             
     def update_image(self, param: str, value: float):
         """Update image with new effect parameters"""
         if self.original_image is None:
             return
             
+        self.current_settings[param] = float(value)
+
+        # Coalesce rapid slider ticks into a single recompute
+        if self._effect_timer is not None:
+            self.after_cancel(self._effect_timer)
+        self._effect_timer = self.after(40, self._do_apply)
+
+    def _on_slider_press(self, event=None):
+        """Switch rendering to the draft copy for the duration of a drag"""
+        self._dragging = True
+
+    def _on_slider_release(self, event=None):
+        """Re-render the final slider value on the preview copy right away"""
+        self._dragging = False
+        if self.original_image is None:
+            return
+        if self._effect_timer is not None:
+            self.after_cancel(self._effect_timer)
+        self._do_apply()
+
+    def _do_apply(self):
+        """Hand the pending effect update scheduled by update_image to the render worker"""
+        self._effect_timer = None
+
+        # A release or a slider dragged back to where it was needs no new render
+        key = (tuple(self.current_settings.values()), self._dragging)
+        if key == self._effects_key:
+            return
+        self._effects_key = key
+        self._render_seq += 1
+        self._submit_render((self._render_seq, dict(self.current_settings), self._dragging))
+        self._awaited_seq = self._render_seq
+        if self._render_poll is None:
+            self._poll_render_results()
+
+    def _submit_render(self, job: Optional[Tuple[int, Dict[str, float], bool]]):
+        """Queue a render request, replacing any request the worker hasn't picked up yet"""
         try:
-            self.current_settings[param] = float(value)
-            self.apply_effects()
-            self.update_image_display()
-        except Exception as e:
-            self.logger.error(f"Error updating image: {str(e)}")
-            self.show_error("Error applying effects")
+            self._render_queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._render_queue.put_nowait(job)
+
+    def _render_worker(self):
+        """Render queued (seq, settings, draft) jobs off the Tk thread until a None sentinel arrives"""
+        while True:
+            job = self._render_queue.get()
+            if job is None:
+                break
+            seq, settings, draft = job
+            try:
+                with self._render_lock:
+                    image = self.apply_effects(settings=settings, draft=draft)
+                self._render_results.put((seq, image, None))
+            except Exception:
+                self.logger.exception("Error updating image")
+                self._render_results.put((seq, None, "Error applying effects"))
+
+    def _poll_render_results(self):
+        """Apply finished renders on the Tk thread, polling until the latest request has come back"""
+        self._render_poll = None
+        finished = False
+        while not self._render_results.empty():
+            seq, image, error = self._render_results.get_nowait()
+            finished = finished or seq >= self._awaited_seq
+            if error is not None:
+                self.show_error(error)
+            elif image is not None:
+                self._deliver(seq, image)
+        if not finished:
+            self._render_poll = self.after(self.RENDER_POLL_MS, self._poll_render_results)
+
+    def _deliver(self, seq: int, image: Image.Image):
+        """Swap in a rendered image on the Tk thread unless a newer request superseded it"""
+        if self.original_image is None or seq != self._render_seq:
+            return
+        self.image = image
+        self.update_image_display()
             
-    def apply_effects(self):
-        """Apply all effects to the image"""
+    def apply_effects(self, full_res: bool = False,
+                      settings: Optional[Dict[str, float]] = None,
+                      draft: bool = False) -> Optional[Image.Image]:
+        """Apply all effects to the preview, draft or full resolution image and return the result"""
         if self.original_image is None:
-            return
+            return None
+        if settings is None:
+            settings = self.current_settings
+
+        # With every slider at zero the preview is already the result; nothing mutates it in place
+        if not full_res and not any(settings.values()):
+            return self._draft_image if draft else self._preview_image
             
         try:
-            # Start with a fresh copy of the original image
-            self.image = self.original_image.copy()
-            
-            # Apply effects in optimal order
-            if self.current_settings['brightness'] != 0:
-                enhancer = ImageEnhance.Brightness(self.image)
-                self.image = enhancer.enhance(1 + self.current_settings['brightness'] / 100)
-                
-            if self.current_settings['contrast'] != 0:
-                enhancer = ImageEnhance.Contrast(self.image)
-                self.image = enhancer.enhance(1 + self.current_settings['contrast'] / 100)
-                
-            if self.current_settings['saturation'] != 0:
-                enhancer = ImageEnhance.Color(self.image)
-                self.image = enhancer.enhance(1 + self.current_settings['saturation'] / 100)
-                
-            if self.current_settings['sharpness'] != 0:
-                enhancer = ImageEnhance.Sharpness(self.image)
-                self.image = enhancer.enhance(1 + self.current_settings['sharpness'] / 100)
+            if full_res:
+                source, alpha = self._original_arr, self._original_alpha
+            elif draft:
+                source, alpha = self._draft_arr, self._draft_alpha
+            else:
+                source, alpha = self._preview_arr, self._preview_alpha
+
+            # Tone stages in pipeline order; each output is cached until its inputs change
+            brightness, contrast, saturation, sharpness = (
+                int(round(settings[name])) for name in ('brightness', 'contrast', 'saturation', 'sharpness'))
+            stages = (
+                ((brightness, contrast), self._adjust_brightness_contrast),
+                ((saturation,), self._adjust_saturation),
+                ((sharpness,), self._adjust_sharpness),
+            )
+
+            # Reuse cached stage outputs up to the first stage whose parameters changed
+            arr = source
+            reuse = self._stage_source is source
+            for index, (key, stage) in enumerate(stages):
+                if reuse and index < len(self._stage_cache) and self._stage_cache[index][0] == key:
+                    arr = self._stage_cache[index][1]
+                    continue
+                reuse = False
+                arr = stage(arr, *key)
+                del self._stage_cache[index:]
+                self._stage_cache.append((key, arr))
+            self._stage_source = source
                 
-            # Apply noise if needed
-            if self.current_settings['noise'] != 0:
-                self._apply_noise()
+            # Noise is stochastic, so it is never cached
+            if settings['noise'] != 0:
+                arr = self._apply_noise(arr, abs(settings['noise']))
+
+            image = Image.fromarray(arr)
+            if alpha is not None:
+                image.putalpha(Image.fromarray(alpha))
+            return image
                 
-        except Exception as e:
-            self.logger.error(f"Error applying effects: {str(e)}")
-            self.show_error("Error applying effects")
+        except Exception:
+            self.logger.exception("Error applying effects")
+            raise
             
-    def _apply_noise(self):
-        """Apply noise effect to the image"""
+    @staticmethod
+    def _split_alpha(image: Image.Image) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Split an RGB/RGBA image into a contiguous RGB array and an optional alpha array"""
+        arr = np.asarray(image)
+        if image.mode == 'RGBA':
+            return np.ascontiguousarray(arr[..., :3]), np.ascontiguousarray(arr[..., 3])
+        return np.ascontiguousarray(arr), None
+
+    def _stage_buffer(self, name: str, shape) -> np.ndarray:
+        """Return the preallocated output buffer of a stage, reallocating it only when the shape changes"""
+        buffer = self._stage_buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = self._stage_buffers[name] = np.empty(shape, dtype=np.uint8)
+        return buffer
+
+    def _adjust_brightness_contrast(self, arr: np.ndarray, brightness: int, contrast: int) -> np.ndarray:
+        """Apply brightness and contrast in a single LUT pass"""
+        if brightness == 0 and contrast == 0:
+            return arr
+        # Not cv2.convertScaleAbs: the contrast pivot gives a negative offset, and it would fold
+        # the resulting negative values back up via abs() instead of clamping them to 0
+        dst = self._stage_buffer('brightness_contrast', arr.shape)
+        return cv2.LUT(arr, _build_bc_lut(brightness, contrast), dst=dst)
+
+    def _adjust_saturation(self, arr: np.ndarray, saturation: int) -> np.ndarray:
+        """Scale saturation through a LUT on the HSV S channel"""
+        if saturation == 0:
+            return arr
+        # The HSV scratch buffer is converted into, looked up in place and converted back out of
+        hsv = cv2.cvtColor(arr, cv2.COLOR_RGB2HSV, dst=self._stage_buffer('hsv', arr.shape))
+        cv2.LUT(hsv, _build_sat_lut(saturation), dst=hsv)
+        return cv2.cvtColor(hsv, cv2.COLOR_HSV2RGB, dst=self._stage_buffer('saturation', arr.shape))
+
+    def _adjust_sharpness(self, arr: np.ndarray, sharpness: int) -> np.ndarray:
+        """Sharpen with an unsharp mask fused into a single filter2D pass"""
+        if sharpness == 0:
+            return arr
+        return cv2.filter2D(arr, -1, _build_sharpen_kernel(sharpness),
+                            dst=self._stage_buffer('sharpness', arr.shape))
+
+    def _apply_noise(self, img_array: np.ndarray, sigma: float) -> np.ndarray:
+        """Apply noise effect to the image array"""
         try:
-            img_array = np.array(self.image)
-            noise = np.random.normal(0, abs(self.current_settings['noise']), img_array.shape)
-            noisy_img = img_array + noise
-            noisy_img = np.clip(noisy_img, 0, 255).astype(np.uint8)
-            self.image = Image.fromarray(noisy_img)
-        except Exception as e:
-            self.logger.error(f"Error applying noise: {str(e)}")
+            # The pipeline only hands over contiguous (H, W, 3) uint8 arrays
+            if self._noise_out is None or self._noise_out.shape != img_array.shape:
+                self._noise_out = np.empty_like(img_array)
+            if NUMBA_AVAILABLE:
+                with NUMBA_LOCK:
+                    _noise_kernel(img_array, self._noise_out, float(sigma))
+                return self._noise_out
+
+            # The int16 noise buffer is reallocated only when the image shape changes; randn fills
+            # it in place through a flat view, since a scalar sigma only reaches the first channel
+            if self._noise_i16 is None or self._noise_i16.shape != img_array.shape:
+                self._noise_i16 = np.empty(img_array.shape, dtype=np.int16)
+            cv2.randn(self._noise_i16.reshape(-1), 0, sigma)
+            # cv2.add saturates to uint8 in the same pass as the add
+            return cv2.add(img_array, self._noise_i16, dst=self._noise_out, dtype=cv2.CV_8U)
+        except Exception:
+            self.logger.exception("Error applying noise")
             raise
             
     def update_image_display(self):
@@ -420,38 +704,41 @@ class ImageEditor(ctk.CTkToplevel):
                     new_height = min_size
                     new_width = int(min_size * (img_width / img_height))
 
-            # Create a copy and resize
-            display_image = self.image.copy()
-            display_image = display_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-            # Convert to RGB mode
-            if display_image.mode != 'RGB':
-                display_image = display_image.convert('RGB')
-
-            # Clean up old photo if exists
-            if hasattr(self, 'display_photo') and self.display_photo:
-                del self.display_photo
-                gc.collect()
-
-            # Create new CTkImage with explicit size
-            self.display_photo = ctk.CTkImage(
-                light_image=display_image,
-                dark_image=display_image,
-                size=(new_width, new_height)
-            )
-
-            # Update label
-            if self.image_label:
-                self.image_label.configure(image=self.display_photo, text="")
-                self.logger.info(f"Image displayed successfully: {new_width}x{new_height}")
-
-            # Clean up
-            del display_image
-            gc.collect()
+            # <Configure> also fires for child widgets; nothing to redraw if neither input changed
+            if self.image is self._displayed_image and (new_width, new_height) == self._last_display_size:
+                return
+
+            # Resize with OpenCV: INTER_AREA when shrinking, bilinear when enlarging
+            interpolation = cv2.INTER_AREA if new_width < img_width else cv2.INTER_LINEAR
+            display_image = Image.fromarray(cv2.resize(
+                np.asarray(self.image),
+                (new_width, new_height),
+                interpolation=interpolation
+            ))
+
+            if self.display_photo is None:
+                # Create the CTkImage once with explicit size
+                self.display_photo = ctk.CTkImage(
+                    light_image=display_image,
+                    dark_image=display_image,
+                    size=(new_width, new_height)
+                )
+                if self.image_label:
+                    self.image_label.configure(image=self.display_photo, text="")
+            else:
+                # Swap the pixels of the existing CTkImage; the label refreshes through its callback
+                self.display_photo.configure(
+                    light_image=display_image,
+                    dark_image=display_image,
+                    size=(new_width, new_height)
+                )
+            self._displayed_image = self.image
+            self._last_display_size = (new_width, new_height)
+            self.logger.info(f"Image displayed successfully: {new_width}x{new_height}")
 
         except Exception as e:
-            self.logger.error(f"Error updating display: {str(e)}")
-            self.show_error(f"Error updating display: {str(e)}")
+            self.logger.exception("Error updating display")
+            self.show_error(f"Error updating display: {e}")
 
     def on_window_resize(self, event=None):
         """Handle window resize events"""
@@ -464,39 +751,69 @@ class ImageEditor(ctk.CTkToplevel):
     def reset_effects(self):
         """Reset all effects to their default values"""
         try:
+            unchanged = self.image is self._preview_image and not any(self.current_settings.values())
             for param, slider in self.sliders.items():
                 slider.set(0)
                 self.current_settings[param] = 0
-                
-            if self.original_image:
-                self.image = self.original_image.copy()
+
+            # Any render still in flight was computed for the old settings
+            self._render_seq += 1
+            self._effects_key = (tuple(self.current_settings.values()), False)
+            if self._preview_image and not unchanged:
+                self.image = self._preview_image
                 self.update_image_display()
-        except Exception as e:
-            self.logger.error(f"Error resetting effects: {str(e)}")
+        except Exception:
+            self.logger.exception("Error resetting effects")
             self.show_error("Error resetting effects")
             
     def show_error(self, message: str):
-        """Display error message to user"""
-        messagebox.showerror("Error", message)
+        """Display error message to user, suppressing new dialogs while one is already open"""
+        if self._error_pending:
+            self.logger.warning(f"Suppressed error dialog: {message}")
+            return
+
+        self._error_pending = True
+        try:
+            messagebox.showerror("Error", message)
+        finally:
+            self._error_pending = False
 
     def on_closing(self):
         """Clean up resources before closing"""
         try:
             # Clean up resources
+            if self._effect_timer is not None:
+                self.after_cancel(self._effect_timer)
+                self._effect_timer = None
+            if self._render_poll is not None:
+                self.after_cancel(self._render_poll)
+                self._render_poll = None
+            self._submit_render(None)
+
             if hasattr(self, 'image_label'):
                 self.image_label.configure(image='')
             
-            if hasattr(self, 'display_photo'):
-                del self.display_photo
+            self.display_photo = None
+            self._displayed_image = None
             
             self.image = None
             self.original_image = None
-            gc.collect()
+            self._preview_image = None
+            self._original_arr = None
+            self._preview_arr = None
+            self._original_alpha = None
+            self._preview_alpha = None
+            self._draft_image = None
+            self._draft_arr = None
+            self._draft_alpha = None
+            self._stage_buffers.clear()
+            self._stage_cache.clear()
+            self._stage_source = None
             
             self.logger.info("Closing Image Editor")
             self.destroy()
-        except Exception as e:
-            self.logger.error(f"Error during cleanup: {str(e)}")
+        except Exception:
+            self.logger.exception("Error during cleanup")
             self.destroy()
 
 if __name__ == "__main__":
@@ -504,5 +821,5 @@ if __name__ == "__main__":
         app = ImageEditor()
         app.mainloop()
     except Exception as e:
-        logging.error(f"Application crashed: {str(e)}", exc_info=True)
+        logging.error("Application crashed: %s", e, exc_info=True)
         sys.exit(1)
\ No newline at end of file
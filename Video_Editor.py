@@ -6,12 +6,24 @@ from customtkinter import filedialog
 from PIL import Image, ImageTk
 import tempfile
 import os
+import time
+import queue
 from threading import Thread, Event
 import logging
-from typing import Dict, Optional, Tuple, Callable
+from typing import Dict, List, Optional, Tuple, Callable
 import gc
 from tkinter import messagebox
 
+try:
+    from numba import get_num_threads, njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from numba_lock import NUMBA_LOCK
+
+cv2.setUseOptimized(True)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,23 +34,100 @@ logging.basicConfig(
     ]
 )
 
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, nogil=True, fastmath=True, cache=True)
+    def _frame_kernel(frame, lut, noise):
+        """Apply the gain LUT and add int16 noise to a uint8 frame in place, clamping in the same pass"""
+        height, width, channels = frame.shape
+        for i in prange(height):
+            for j in range(width):
+                for c in range(channels):
+                    value = np.int32(lut[frame[i, j, c]]) + noise[i, j, c]
+                    if value < 0:
+                        frame[i, j, c] = 0
+                    elif value > 255:
+                        frame[i, j, c] = 255
+                    else:
+                        frame[i, j, c] = np.uint8(value)
+
+def _open_capture(video_path: str) -> cv2.VideoCapture:
+    """Open a video through FFmpeg with hardware decoding if available, else with the default backend"""
+    cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG,
+                           [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+    if cap.isOpened():
+        return cap
+    cap.release()
+    return cv2.VideoCapture(video_path)
+
+def _open_writer(path: str, fps: float, size: Tuple[int, int]) -> cv2.VideoWriter:
+    """Open an H.264 writer on a hardware encoder if FFmpeg has one, else the software mp4v writer"""
+    out = cv2.VideoWriter(path, cv2.CAP_FFMPEG, cv2.VideoWriter_fourcc(*'avc1'), fps, size,
+                          [cv2.VIDEOWRITER_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+    if out.isOpened():
+        return out
+    out.release()
+    logging.getLogger(__name__).info("No hardware H.264 encoder available, using mp4v")
+    return cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'mp4v'), fps, size)
+
 class VideoProcessor(Thread):
     """Thread class for processing video files with effects"""
     
+    # Extra rows/columns of pre-generated noise, so each frame can read it at a random offset
+    NOISE_TILE_MARGIN = 64
+    # Frame buffers shared by the decode, effect and encode stages
+    RING_SIZE = 8
+    
     def __init__(self, video_path: str, settings: Dict[str, float], callback: Callable):
         super().__init__()
         self.video_path = video_path
-        self.settings = settings
+        # Snapshot the sliders: the whole video is rendered with the values at start
+        self.settings = dict(settings)
         self.callback = callback
         self.is_running = True
         self.stop_event = Event()
         self.logger = logging.getLogger(__name__)
+        self._noise_tile: Optional[np.ndarray] = None
+        self._noise_sigma = 0.0
+        self._rng = np.random.default_rng()
+        self._pipeline_error: Optional[Exception] = None
+        self._sigma = max(self.settings['noise'], 0.0)
+        
+        # Brightness and contrast are both plain gains, so they fold into one 256-entry table
+        gain = (1.0 + settings['brightness'] / 100.0) * (1.0 + settings['contrast'] / 100.0)
+        self.lut: Optional[np.ndarray] = None
+        if settings['brightness'] != 0 or settings['contrast'] != 0:
+            self.lut = np.clip(np.arange(256, dtype=np.float32) * gain, 0, 255).astype(np.uint8)
+        if NUMBA_AVAILABLE:
+            # Launch Numba's worker pool from the creating (Tk) thread rather than from run();
+            # with the TBB layer a pool first started off the main thread hangs shutdown
+            get_num_threads()
+            
+        # The settings can't change during a run, so choose the routine for this combination
+        # of effects once; the per-frame call then has no branches on the settings
+        self._effect_fn: Callable[[np.ndarray], np.ndarray] = {
+            (False, False): self._passthrough,
+            (True, False): self._apply_gain,
+            (False, True): self._apply_noise,
+            (True, True): self._apply_gain_noise,
+        }[(self.lut is not None, self._sigma > 0)]
         
     def run(self):
+        """Process the video with OpenCV's thread pool sized for the pipeline"""
+        # Leave one core each for the decode and encode threads; OpenCV's own pool gets the rest.
+        # The setting is process-wide, so the image editor gets its threads back afterwards
+        previous_threads = cv2.getNumThreads()
+        cv2.setNumThreads(max(1, (os.cpu_count() or 1) - 2))
+        try:
+            self._process()
+        finally:
+            cv2.setNumThreads(previous_threads)
+            
+    def _process(self):
         """Main processing loop for video effects"""
+        temp_file = None
         try:
             # Open input video
-            cap = cv2.VideoCapture(self.video_path)
+            cap = _open_capture(self.video_path)
             if not cap.isOpened():
                 raise Exception("Could not open video file")
                 
@@ -46,39 +135,78 @@ class VideoProcessor(Thread):
             fps = int(cap.get(cv2.CAP_PROP_FPS))
             width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
             height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            total_frames = max(1, int(cap.get(cv2.CAP_PROP_FRAME_COUNT)))
             
             # Create output video file
             temp_file = tempfile.mktemp(suffix='.mp4')
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-            out = cv2.VideoWriter(temp_file, fourcc, fps, (width, height))
+            out = _open_writer(temp_file, fps, (width, height))
             
             frame_count = 0
+            last_progress = -1
             
-            while cap.isOpened():
-                if self.stop_event.is_set():
-                    self.logger.info("Processing cancelled")
-                    break
-                    
-                ret, frame = cap.read()
-                if not ret:
-                    break
+            if NUMBA_AVAILABLE and self._effect_fn == self._apply_gain_noise:
+                # Compile (or load the cached build) before the first real frame
+                with NUMBA_LOCK:
+                    _frame_kernel(np.zeros((2, 2, 3), dtype=np.uint8), self.lut,
+                                  np.zeros((3, 3, 3), dtype=np.int16)[1:, 1:])
+            
+            # Decode and encode run on their own threads so they overlap with the effects.
+            # Frames live in a fixed ring of buffers that the decoder reuses; the stages only
+            # pass ring indices around, the free list applies back-pressure and None marks the end
+            ring: List[Optional[np.ndarray]] = [None] * self.RING_SIZE
+            free: queue.SimpleQueue = queue.SimpleQueue()
+            frames: queue.SimpleQueue = queue.SimpleQueue()
+            processed: queue.SimpleQueue = queue.SimpleQueue()
+            for index in range(self.RING_SIZE):
+                free.put(index)
+            reader = Thread(target=self._read_frames, args=(cap, ring, free, frames), daemon=True)
+            writer = Thread(target=self._write_frames, args=(out, ring, processed, free), daemon=True)
+            reader.start()
+            writer.start()
+            
+            # Bound once so the per-frame loop is just the queue hand-offs and the effect calls
+            get_frame, put_frame, apply_effects = frames.get, processed.put, self._effect_fn
+            cancelled = self.stop_event.is_set
+            try:
+                while True:
+                    index = get_frame()
+                    if index is None:
+                        break
+                    if cancelled():
+                        put_frame(index)  # Keep the buffers cycling until the reader notices the cancel
+                        continue
+                        
+                    # Process frame with effects, in place on the ring buffer
+                    apply_effects(ring[index])
+                    put_frame(index)
                     
-                # Process frame with effects
-                processed_frame = self.apply_effects(frame)
-                
-                # Write processed frame
-                out.write(processed_frame)
-                
-                # Update progress
-                frame_count += 1
-                progress = int((frame_count / total_frames) * 100)
-                self.callback("progress", progress)
-                
-            # Clean up
-            cap.release()
-            out.release()
+                    # Update progress, only when the whole percentage changes
+                    frame_count += 1
+                    progress = frame_count * 100 // total_frames
+                    if progress != last_progress:
+                        last_progress = progress
+                        self.callback("progress", progress)
+            except Exception as e:
+                # Return buffers to the reader until it sees the stop and shuts down
+                self._pipeline_error = e
+                self.stop_event.set()
+                while True:
+                    index = frames.get()
+                    if index is None:
+                        break
+                    free.put(index)
+                raise
+            finally:
+                processed.put(None)
+                writer.join()
+                reader.join()
+                # Clean up
+                cap.release()
+                out.release()
             
+            if self._pipeline_error is not None:
+                raise self._pipeline_error
+                
             if not self.stop_event.is_set():
                 self.logger.info(f"Video processing completed: {temp_file}")
                 self.callback("finished", temp_file)
@@ -88,34 +216,100 @@ class VideoProcessor(Thread):
                     os.remove(temp_file)
                     
         except Exception as e:
-            self.logger.error(f"Error processing video: {str(e)}")
+            # Frame errors surface here once for the whole run rather than per frame
+            self.logger.error("Error processing video: %s", e)
+            if temp_file and os.path.exists(temp_file):
+                os.remove(temp_file)
             self.callback("error", str(e))
             
-    def apply_effects(self, frame: np.ndarray) -> np.ndarray:
-        """Apply visual effects to a single frame"""
+    def _read_frames(self, cap: cv2.VideoCapture, ring: List[Optional[np.ndarray]],
+                     free: queue.SimpleQueue, frames: queue.SimpleQueue):
+        """Decode frames into free ring buffers until the video ends or processing is cancelled"""
         try:
-            # Convert frame to float32 for calculations
-            frame = frame.astype(np.float32)
+            while cap.isOpened():
+                index = free.get()
+                if self.stop_event.is_set():
+                    if self._pipeline_error is None:
+                        self.logger.info("Processing cancelled")
+                    break
+                    
+                # read() decodes into the existing buffer when its shape matches
+                ret, frame = cap.read(ring[index])
+                if not ret:
+                    break
+                ring[index] = frame
+                frames.put(index)
+        except Exception as e:
+            self.logger.error("Error reading video: %s", e)
+            self._pipeline_error = e
+            self.stop_event.set()
+        finally:
+            frames.put(None)
             
-            # Apply effects based on settings
-            if self.settings['brightness'] != 0:
-                frame = frame * (1.0 + self.settings['brightness'] / 100.0)
-                
-            if self.settings['contrast'] != 0:
-                frame = frame * (1.0 + self.settings['contrast'] / 100.0)
-                
-            if self.settings['noise'] > 0:
-                noise = np.random.normal(0, self.settings['noise'], frame.shape)
-                frame = frame + noise
-                
-            # Clip values to valid range and convert back to uint8
-            frame = np.clip(frame, 0, 255).astype(np.uint8)
+    def _write_frames(self, out: cv2.VideoWriter, ring: List[Optional[np.ndarray]],
+                      processed: queue.SimpleQueue, free: queue.SimpleQueue):
+        """Encode processed ring buffers and hand them back until the None sentinel arrives"""
+        while True:
+            index = processed.get()
+            if index is None:
+                break
+            try:
+                if not self.stop_event.is_set():
+                    out.write(ring[index])
+            except Exception as e:
+                self.logger.error("Error writing video: %s", e)
+                self._pipeline_error = e
+                self.stop_event.set()
+            finally:
+                free.put(index)
             
+    def apply_effects(self, frame: np.ndarray) -> np.ndarray:
+        """Apply visual effects to a single frame in place; errors are handled by run()"""
+        return self._effect_fn(frame)
+        
+    def _passthrough(self, frame: np.ndarray) -> np.ndarray:
+        """Return the frame unchanged when no effect is enabled"""
+        return frame
+        
+    def _apply_gain(self, frame: np.ndarray) -> np.ndarray:
+        """Apply the brightness/contrast LUT in place"""
+        cv2.LUT(frame, self.lut, dst=frame)
+        return frame
+        
+    def _apply_noise(self, frame: np.ndarray) -> np.ndarray:
+        """Add noise in place"""
+        # A single saturating SIMD add beats the kernel's identity-LUT gather
+        cv2.add(frame, self._noise_view(frame.shape, self._sigma), dst=frame, dtype=cv2.CV_8U)
+        return frame
+        
+    def _apply_gain_noise(self, frame: np.ndarray) -> np.ndarray:
+        """Apply the brightness/contrast LUT and add noise in place"""
+        noise = self._noise_view(frame.shape, self._sigma)
+        if NUMBA_AVAILABLE:
+            # Gain, noise and clamp fused into one parallel pass over the frame; the lock keeps it
+            # from running alongside the image editor's kernel
+            with NUMBA_LOCK:
+                _frame_kernel(frame, self.lut, noise)
             return frame
             
-        except Exception as e:
-            self.logger.error(f"Error applying effects to frame: {str(e)}")
-            return frame.astype(np.uint8)
+        # Saturating add straight into the frame buffer returned by the decoder
+        cv2.LUT(frame, self.lut, dst=frame)
+        cv2.add(frame, noise, dst=frame, dtype=cv2.CV_8U)
+        return frame
+            
+    def _noise_view(self, shape: Tuple[int, ...], sigma: float) -> np.ndarray:
+        """Return a randomly offset window of a pre-generated int16 noise tile matching the frame shape"""
+        margin = self.NOISE_TILE_MARGIN
+        height, width = shape[:2]
+        tile_shape = (height + margin, width + margin) + tuple(shape[2:])
+        if self._noise_tile is None or self._noise_tile.shape != tile_shape or self._noise_sigma != sigma:
+            # Generated once per shape and sigma; the flat view makes randn treat it as one
+            # channel, otherwise a scalar sigma only reaches the first channel
+            self._noise_tile = np.empty(tile_shape, dtype=np.int16)
+            cv2.randn(self._noise_tile.reshape(-1), 0, sigma)
+            self._noise_sigma = sigma
+        y, x = self._rng.integers(0, margin, size=2)
+        return self._noise_tile[y:y + height, x:x + width]
             
     def stop(self):
         """Stop video processing"""
@@ -124,6 +318,8 @@ class VideoProcessor(Thread):
 
 class VideoPlayer:
     """Video player component for previewing videos"""
+    DISPLAY_RING_SIZE = 3  # Buffers in flight: one being drawn, one queued, one being filled
+
     def __init__(self, parent, width=640, height=480):
         self.parent = parent
         self.width = width
@@ -131,11 +327,19 @@ class VideoPlayer:
         self.is_playing = False
         self.current_frame = None
         self.cap = None
+        self._display_size: Tuple[int, int] = (width, height)
+        self._display_ring: List[np.ndarray] = []
+        self._interpolation = cv2.INTER_AREA
+        self._frames: queue.Queue = queue.Queue(maxsize=1)
+        self._decode_stop = Event()
+        self._decode_thread: Optional[Thread] = None
+        self._poll_ms = 15
         self.logger = logging.getLogger(__name__)
         
-        # Create video display canvas
+        # Create video display canvas with a single image item that is reused for every frame
         self.canvas = ctk.CTkCanvas(parent, width=width, height=height, bg='black')
         self.canvas.pack(pady=10)
+        self.image_id = self.canvas.create_image(width // 2, height // 2, anchor='center')
         
         # Create control buttons
         self.controls_frame = ctk.CTkFrame(parent)
@@ -151,15 +355,35 @@ class VideoPlayer:
         """Load a video file for playback"""
         if self.cap is not None:
             self.stop()
+            self._release_capture()
             
-        self.cap = cv2.VideoCapture(video_path)
+        self.cap = _open_capture(video_path)
         if not self.cap.isOpened():
             self.logger.error(f"Could not open video: {video_path}")
+            self._release_capture()
             return False
             
         # Get video properties
-        self.fps = self.cap.get(cv2.CAP_PROP_FPS)
-        self.frame_delay = int(1000 / self.fps)  # Delay in milliseconds
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self._frame_period = 1.0 / self.fps  # Seconds per frame
+        self._poll_ms = max(1, int(self._frame_period * 500))  # Poll for frames twice per frame period
+        
+        # Fit the frame inside the canvas once, keeping its aspect ratio
+        src_width = self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)
+        src_height = self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
+        if src_width > 0 and src_height > 0:
+            scale = min(self.width / src_width, self.height / src_height)
+            self._display_size = (max(1, int(src_width * scale)), max(1, int(src_height * scale)))
+            self._interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR
+        else:
+            self._display_size = (self.width, self.height)
+            self._interpolation = cv2.INTER_AREA
+            
+        # Allocate the display buffers and the Tk photo once per video; frames are pasted into it
+        width, height = self._display_size
+        self._display_ring = [np.empty((height, width, 3), np.uint8) for _ in range(self.DISPLAY_RING_SIZE)]
+        self.current_frame = ImageTk.PhotoImage('RGB', self._display_size)
+        self.canvas.itemconfigure(self.image_id, image=self.current_frame, state='normal')
         return True
         
     def toggle_play(self):
@@ -168,65 +392,143 @@ class VideoPlayer:
             return
             
         if self.is_playing:
-            self.is_playing = False
-            self.play_button.configure(text="Play")
+            self.pause()
         else:
             self.is_playing = True
             self.play_button.configure(text="Pause")
+            self.canvas.itemconfigure(self.image_id, state='normal')
+            self._decode_stop.clear()
+            self._decode_thread = Thread(target=self._decode_frames, daemon=True)
+            self._decode_thread.start()
             self.play()
             
+    def pause(self):
+        """Pause playback at the current frame"""
+        self._stop_decoder()
+        self.play_button.configure(text="Play")
+        
     def play(self):
-        """Play video frame by frame"""
-        if not self.is_playing or self.cap is None:
+        """Draw the next decoded frame and poll for the one after it"""
+        if not self.is_playing:
             return
             
-        ret, frame = self.cap.read()
-        if ret:
-            # Resize frame to fit canvas
-            frame = cv2.resize(frame, (self.width, self.height))
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            image = Image.fromarray(frame)
-            photo = ImageTk.PhotoImage(image=image)
-            
-            # Update canvas
-            self.current_frame = photo
-            self.canvas.create_image(0, 0, anchor='nw', image=photo)
+        try:
+            frame = self._frames.get_nowait()
+        except queue.Empty:
+            self.parent.after(self._poll_ms, self.play)
+            return
             
-            # Schedule next frame
-            self.parent.after(self.frame_delay, self.play)
-        else:
+        if frame is None:
             # Video ended
+            self._stop_decoder()
             self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-            self.is_playing = False
             self.play_button.configure(text="Play")
+            return
             
+        # Only the pixel copy into the existing photo happens on the Tk thread
+        self.current_frame.paste(Image.fromarray(frame))
+        self.parent.after(self._poll_ms, self.play)
+        
+    def _decode_frames(self):
+        """Read, resize and colour-convert frames at the video's frame rate on a worker thread"""
+        try:
+            cap = self.cap
+            ring = self._display_ring
+            period = self._frame_period
+            frame = None
+            index = 0
+            next_frame_time = time.perf_counter()
+            while not self._decode_stop.is_set():
+                delay = next_frame_time - time.perf_counter()
+                if delay > 0 and self._decode_stop.wait(delay):
+                    return
+                    
+                # When running more than a frame behind schedule, skip the late frames with grab()
+                # so they are never decoded or drawn
+                behind = max(0, int((time.perf_counter() - next_frame_time) / period))
+                for _ in range(behind):
+                    if not cap.grab():
+                        break
+                next_frame_time += (behind + 1) * period
+                
+                ret, frame = cap.read(frame)
+                if not ret:
+                    break
+                    
+                # Resize into a ring buffer and swap BGR->RGB in place; the ring is deep enough
+                # that the buffer being filled is never the one the Tk thread is pasting
+                buffer = ring[index]
+                index = (index + 1) % len(ring)
+                cv2.resize(frame, self._display_size, dst=buffer, interpolation=self._interpolation)
+                cv2.cvtColor(buffer, cv2.COLOR_BGR2RGB, dst=buffer)
+                if not self._put_frame(buffer):
+                    return
+        except Exception:
+            self.logger.exception("Error decoding preview frames")
+        self._put_frame(None)
+        
+    def _put_frame(self, frame) -> bool:
+        """Hand a frame to the Tk thread, giving up if playback is stopped"""
+        while not self._decode_stop.is_set():
+            try:
+                self._frames.put(frame, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+        
+    def _stop_decoder(self):
+        """Stop the decode thread and discard any frame it left queued"""
+        self.is_playing = False
+        self._decode_stop.set()
+        if self._decode_thread is not None:
+            self._decode_thread.join()
+            self._decode_thread = None
+        while True:
+            try:
+                self._frames.get_nowait()
+            except queue.Empty:
+                break
+                
     def stop(self):
         """Stop video playback"""
-        self.is_playing = False
+        self._stop_decoder()
         self.play_button.configure(text="Play")
+        # Rewind rather than release so the next play doesn't reopen and re-index the file
         if self.cap is not None:
-            self.cap.release()
-            self.cap = None
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
         # Clear canvas
-        self.canvas.delete("all")
+        self.canvas.itemconfigure(self.image_id, state='hidden')
         
+    def _release_capture(self):
+        """Close the current video file"""
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+            
     def destroy(self):
         """Clean up resources"""
         self.stop()
+        self._release_capture()
         self.canvas.destroy()
         self.controls_frame.destroy()
 
-class VideoEditor(ctk.CTk):
+class VideoEditor(ctk.CTkToplevel):
     """Video Editor application for applying effects to video files"""
     
-    def __init__(self):
-        super().__init__()
+    EVENT_POLL_MS = 50  # How often the Tk thread picks up video processor events
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
         self.logger = logging.getLogger(__name__)
         
         # Initialize variables
         self.video_processor: Optional[VideoProcessor] = None
         self.video_player: Optional[VideoPlayer] = None
         self.current_video_path: Optional[str] = None
+        # The processor thread only queues its events; the Tk thread applies them from an after() poll
+        self._process_events: queue.SimpleQueue = queue.SimpleQueue()
+        self._event_poll: Optional[str] = None
         self.current_settings: Dict[str, float] = {
             'noise': 0.0,
             'brightness': 0.0,
@@ -351,8 +653,8 @@ class VideoEditor(ctk.CTk):
                     self.video_player.load_video(filename)
                     
         except Exception as e:
-            self.logger.error(f"Error opening video: {str(e)}")
-            self.show_error(f"Error opening video: {str(e)}")
+            self.logger.error("Error opening video: %s", e)
+            self.show_error(f"Error opening video: {e}")
             
     def process_video(self):
         """Start video processing in a separate thread"""
@@ -375,9 +677,11 @@ class VideoEditor(ctk.CTk):
                 self.process_callback
             )
             self.video_processor.start()
+            if self._event_poll is None:
+                self._poll_process_events()
             
         except Exception as e:
-            self.logger.error(f"Error starting video processing: {str(e)}")
+            self.logger.error("Error starting video processing: %s", e)
             self.show_error("Error starting video processing")
             
     def cancel_processing(self):
@@ -386,11 +690,30 @@ class VideoEditor(ctk.CTk):
             self.logger.info("Cancelling video processing")
             self.video_processor.stop()
             self.video_processor.join()
+            # Drop events the cancelled run queued before it stopped
+            while not self._process_events.empty():
+                self._process_events.get_nowait()
             self.process_button.configure(state="normal")
             self.cancel_button.configure(state="disabled")
             
     def process_callback(self, status: str, data: any):
         """Handle callbacks from video processor"""
+        # Called from the processing thread: no Tk calls here, the event is applied by the poll
+        self._process_events.put((status, data))
+        
+    def _poll_process_events(self):
+        """Apply queued video processor events on the Tk thread, polling while processing runs"""
+        self._event_poll = None
+        # Checked before draining: once the thread has exited, all its events are already queued
+        running = self.video_processor is not None and self.video_processor.is_alive()
+        while not self._process_events.empty():
+            status, data = self._process_events.get_nowait()
+            self._handle_process_event(status, data)
+        if running:
+            self._event_poll = self.after(self.EVENT_POLL_MS, self._poll_process_events)
+            
+    def _handle_process_event(self, status: str, data: any):
+        """Apply a video processor event to the UI"""
         if status == "progress":
             self.progress_bar.set(data / 100)
         elif status == "finished":
@@ -415,20 +738,34 @@ class VideoEditor(ctk.CTk):
         """Display success message to user"""
         messagebox.showinfo("Success", message)
         
+    def on_hide(self):
+        """Pause the preview when the launcher hides this window"""
+        if self.video_player and self.video_player.is_playing:
+            self.video_player.pause()
+            
     def on_closing(self):
         """Clean up resources before closing"""
         try:
             self.cancel_processing()
+            if self._event_poll is not None:
+                self.after_cancel(self._event_poll)
+                self._event_poll = None
+            if self.video_player:
+                self.video_player.destroy()
             self.logger.info("Closing Video Editor")
-            self.quit()
+            self.destroy()
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {str(e)}")
-            self.quit()
+            self.logger.error("Error during cleanup: %s", e)
+            self.destroy()
 
 if __name__ == "__main__":
     try:
-        app = VideoEditor()
-        app.mainloop()
+        # The editor is a Toplevel; run it on a hidden root and end the program when it closes
+        root = ctk.CTk()
+        root.withdraw()
+        app = VideoEditor(root)
+        app.bind("<Destroy>", lambda event: root.quit() if event.widget is app else None)
+        root.mainloop()
     except Exception as e:
-        logging.error(f"Application crashed: {str(e)}", exc_info=True)
+        logging.error("Application crashed: %s", e, exc_info=True)
         sys.exit(1)
\ No newline at end of file
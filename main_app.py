@@ -1,19 +1,94 @@
 import customtkinter as ctk
-from Image_Noise import ImageEditor
-from Video_Editor import VideoEditor  # VideoEditor sınıfını içe aktar
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from tkinter import messagebox
+from threading import Event, Thread
+from tkinter import messagebox, ttk
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('media_editor.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Launcher colours and sizes, shared by every widget that uses them
+THEME = {
+    "bg": "#1E1E1E",          # Window and content background
+    "header_bg": "#2E2E2E", 
+    "title_text": "white",
+    "fg": "#FFFFFF",          # Button face
+    "text": "#000000",        # Button text
+    "hover": "#555555",       # Button hover
+    "border": "#000000",      # Button border
+    "btn_w": 150,
+}
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+LOG_FLUSH_INTERVAL = 1.0  # Seconds between flushes of the buffered log file
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that writes through an 8 KiB buffer instead of flushing after every record"""
+    
+    def _open(self):
+        # FileHandler.errors only exists from Python 3.9
+        return open(self.baseFilename, self.mode, buffering=8192, encoding=self.encoding,
+                    errors=getattr(self, 'errors', None))
+        
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            # Errors go to disk straight away; everything else waits for the periodic flush
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+def _flush_periodically(handler: logging.Handler, stop: Event):
+    """Flush the handler every LOG_FLUSH_INTERVAL seconds until stop is set"""
+    while not stop.wait(LOG_FLUSH_INTERVAL):
+        handler.flush()
+
+def configure_logging():
+    """Route all logging through a background listener to media_editor.log and stdout"""
+    # File records are buffered and written in batches: once a second, when the 8 KiB buffer
+    # fills, as soon as an error is logged, and when logging shuts down at exit
+    file_handler = BufferedFileHandler('media_editor.log')
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    
+    handlers = [file_handler]
+    
+    # There is no console under pythonw; elsewhere make stdout line buffered whether it is a
+    # terminal, a pipe or a file, so log lines reach it whole and in order
+    if sys.stdout is not None:
+        if hasattr(sys.stdout, 'reconfigure'):
+            sys.stdout.reconfigure(line_buffering=True)
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handlers.append(stream_handler)
+    
+    # Log calls only enqueue the record; the file and console writes happen on the listener's
+    # thread, so the Tk main loop never waits on disk or terminal I/O
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    
+    stop_flushing = Event()
+    Thread(target=_flush_periodically, args=(file_handler, stop_flushing),
+           daemon=True).start()
+    atexit.register(stop_flushing.set)
+    
+    # The editor modules configure the root logger for standalone use when they are imported;
+    # force keeps the launcher's handlers in charge even if one was imported before this point
+    logging.basicConfig(
+        force=True,
+        level=logging.INFO,
+        format='%(message)s',  # The listener's handlers apply LOG_FORMAT
+        handlers=[logging.handlers.QueueHandler(log_queue)]
+    )
+    listener.start()
+    # Registered after logging's own exit hook, so it runs first: the queue is drained before
+    # logging.shutdown flushes and closes the handlers
+    atexit.register(listener.stop)
 
 class MainApplication(ctk.CTk):
     """
@@ -32,15 +107,15 @@ class MainApplication(ctk.CTk):
         self.title("Media Editor")
         self.geometry("1200x800")
         self.minsize(800, 600)  # Set minimum window size
-        self.configure(bg="#1E1E1E")  # Set background color to dark
+        self.configure(bg=THEME["bg"])  # Set background color to dark
 
         # Create a title label
-        title_label = ctk.CTkLabel(self, text="Media Editor", font=("Arial", 24), text_color="white", bg_color="#1E1E1E")
-        title_label.pack(pady=(10, 20))
+        title_label = ctk.CTkLabel(self, text="Media Editor", font=("Arial", 24), text_color=THEME["title_text"], bg_color=THEME["bg"])
+        title_label.grid(row=0, column=0, pady=(10, 20))
 
-        # Configure grid layout
+        # Configure grid layout: title, header and content stacked in one column, content stretches
         self.grid_columnconfigure(0, weight=1)
-        self.grid_rowconfigure(1, weight=1)
+        self.grid_rowconfigure(2, weight=1)
         
         # Handle window closing
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -48,17 +123,21 @@ class MainApplication(ctk.CTk):
     def create_ui(self):
         """Create and setup all UI elements"""
         # Create header frame
-        self.header_frame = ctk.CTkFrame(self, bg_color="#2E2E2E")  # Darker header frame
-        self.header_frame.pack(padx=10, pady=10, fill="x")
+        self.header_frame = ctk.CTkFrame(self, bg_color=THEME["header_bg"])
+        self.header_frame.grid(row=1, column=0, padx=10, pady=10, sticky="ew")
         
         # Create buttons with hover effects
         self.create_buttons()
         
         # Content frame for editors
-        self.content_frame = ctk.CTkFrame(self, bg_color="#1E1E1E")  # Dark content frame
-        self.content_frame.pack(padx=10, pady=(0, 10), fill="both", expand=True)
+        self.content_frame = ctk.CTkFrame(self, bg_color=THEME["bg"])
+        self.content_frame.grid(row=2, column=0, padx=10, pady=(0, 10), sticky="nsew")
         
+        # Editor windows are kept alive once created and hidden while another editor is in use
+        self._editors = {}
         self.current_editor = None
+        # Build them hidden once the launcher has been drawn, so the first click only shows a window
+        self.after_idle(self._preload_editors)
         
     def create_buttons(self):
         """Create buttons for image and video editors"""
@@ -66,31 +145,31 @@ class MainApplication(ctk.CTk):
             self.header_frame, 
             text="Image Editor", 
             command=self.open_image_editor,
-            hover_color="#555555",  # Darker hover color
-            fg_color="#FFFFFF",  # White color for button
-            text_color="#000000",  # Black text color
-            width=150,
+            hover_color=THEME["hover"],
+            fg_color=THEME["fg"],
+            text_color=THEME["text"],
+            width=THEME["btn_w"],
             border_width=2,  # Add border for better visibility
-            border_color="#000000"  # Black border for contrast
+            border_color=THEME["border"]
         )
-        self.image_button.pack(side="left", padx=10)
+        self.image_button.grid(row=0, column=0, padx=10)
         
         self.video_button = ctk.CTkButton(
             self.header_frame, 
             text="Video Editor", 
             command=self.open_video_editor,
-            hover_color="#555555",  # Darker hover color
-            fg_color="#FFFFFF",  # White color for button
-            text_color="#000000",  # Black text color
-            width=150,
+            hover_color=THEME["hover"],
+            fg_color=THEME["fg"],
+            text_color=THEME["text"],
+            width=THEME["btn_w"],
             border_width=2,  # Add border for better visibility
-            border_color="#000000"  # Black border for contrast
+            border_color=THEME["border"]
         )
-        self.video_button.pack(side="left", padx=10)
+        self.video_button.grid(row=0, column=1, padx=10)
         
-        # Add a separator for better visual distinction
-        separator = ctk.CTkFrame(self.header_frame, height=2, bg_color="black")
-        separator.pack(side="left", padx=10, fill="y")
+        # Add a separator for better visual distinction; a native ttk widget, not a canvas-drawn CTkFrame
+        separator = ttk.Separator(self.header_frame, orient="vertical")
+        separator.grid(row=0, column=2, padx=10, sticky="ns")
         
         # Add more buttons or features as needed
         
@@ -99,12 +178,12 @@ class MainApplication(ctk.CTk):
         try:
             self.safely_close_current_editor()
             self.logger.info("Opening Image Editor")
-            self.attributes('-topmost', False)  # Ana pencereyi arka plana al
-            self.current_editor = ImageEditor(self)
-            self.current_editor.attributes('-topmost', False)  # Ana uygulamanın üzerinde değil
-            self.current_editor.focus()
+            # Imported on first use so the launcher starts without loading NumPy, OpenCV and PIL
+            from Image_Noise import ImageEditor
+            self.current_editor = self._get_editor('image', ImageEditor)
+            self.after_idle(self._show_editor, self.current_editor, False)  # Ana uygulamanın üzerinde değil
         except Exception as e:
-            self.logger.error(f"Error opening Image Editor: {str(e)}", exc_info=True)  # Hata bilgisi ile logla
+            self.logger.error("Error opening Image Editor: %s", e, exc_info=True)  # Hata bilgisi ile logla
             self.show_error("Failed to open Image Editor")
             
     def open_video_editor(self):
@@ -112,18 +191,61 @@ class MainApplication(ctk.CTk):
         try:
             self.safely_close_current_editor()
             self.logger.info("Opening Video Editor")
-            self.attributes('-topmost', False)  # Ana pencereyi arka plana al
-            self.current_editor = VideoEditor(self)
-            self.current_editor.attributes('-topmost', True)  # VideoEditor'ı ön plana al
-            self.current_editor.focus()
+            from Video_Editor import VideoEditor
+            self.current_editor = self._get_editor('video', VideoEditor)
+            self.after_idle(self._show_editor, self.current_editor, True)  # VideoEditor'ı ön plana al
         except Exception as e:
-            self.logger.error(f"Error opening Video Editor: {str(e)}")
+            self.logger.error("Error opening Video Editor: %s", e)
             self.show_error("Failed to open Video Editor")
             
+    def _show_editor(self, editor, topmost):
+        """Raise an editor above the launcher, applying the window-manager changes in one idle pass"""
+        if not editor.winfo_exists():
+            return
+        self.attributes('-topmost', False)  # Ana pencereyi arka plana al
+        editor.attributes('-topmost', topmost)
+        editor.focus()
+        
+    def _preload_editors(self):
+        """Create both editor windows in the withdrawn state"""
+        try:
+            from Image_Noise import ImageEditor
+            from Video_Editor import VideoEditor
+            for key, editor_class in (('image', ImageEditor), ('video', VideoEditor)):
+                if key not in self._editors:
+                    editor = editor_class(self)
+                    editor.withdraw()
+                    self._editors[key] = editor
+        except Exception as e:
+            # Not fatal: the editor is created on demand when its button is pressed
+            self.logger.error("Error preloading editors: %s", e, exc_info=True)
+            
+    def _get_editor(self, key, editor_class):
+        """Return the cached editor window for key, creating it if it doesn't exist yet"""
+        editor = self._editors.get(key)
+        if editor is None or not editor.winfo_exists():
+            editor = editor_class(self)
+            self._editors[key] = editor
+        else:
+            editor.deiconify()
+        return editor
+        
     def safely_close_current_editor(self):
-        """Safely close the current editor if one exists"""
+        """Safely hide the current editor if one exists"""
         if self.current_editor and self.current_editor.winfo_exists():
-            self.current_editor.destroy()
+            # Let the editor stop background work, such as video playback, while it is hidden
+            on_hide = getattr(self.current_editor, 'on_hide', None)
+            if on_hide is not None:
+                on_hide()
+            self.current_editor.withdraw()
+        self.current_editor = None
+        
+    def close_editors(self):
+        """Close every cached editor window, letting each release its resources"""
+        for editor in self._editors.values():
+            if editor.winfo_exists():
+                editor.on_closing()
+        self._editors.clear()
         self.current_editor = None
         
     def show_error(self, message):
@@ -132,14 +254,15 @@ class MainApplication(ctk.CTk):
         
     def on_closing(self):
         """Handle application shutdown"""
-        self.safely_close_current_editor()
+        self.close_editors()
         self.logger.info("Shutting down application")
         self.quit()
 
 if __name__ == "__main__":
+    configure_logging()
     try:
         app = MainApplication()
         app.mainloop()
     except Exception as e:
-        logging.error(f"Application crashed: {str(e)}", exc_info=True)
+        logging.error("Application crashed: %s", e, exc_info=True)
         sys.exit(1)
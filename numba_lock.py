@@ -0,0 +1,7 @@
+"""Process-wide lock for launching the editors' parallel Numba kernels"""
+import threading
+
+# Both editors can run kernels in one process (the launcher keeps them alive side by side).
+# Numba's workqueue threading layer, the one pip installs get without TBB, aborts the whole
+# process when two threads launch parallel kernels at once, so every launch goes through this lock
+NUMBA_LOCK = threading.Lock()